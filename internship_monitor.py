@@ -11,41 +11,313 @@ Focus: Software Engineering/Programming internships exclusively
 
 import os
 import logging
-import requests
-import time
 import random
 import asyncio
+import contextlib
+import functools
+import hashlib
+import math
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import aiohttp
+import orjson
+import zstandard as zstd
+from aiolimiter import AsyncLimiter
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
 import re
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree
 from dotenv import load_dotenv
 import jobpilot
 from jobpilot.scrapers import LinkedInScraper, ScraperInput
 
+# libuv-based event loop where available; uvloop doesn't support Windows
+try:
+    import uvloop
+    EVENT_LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    EVENT_LOOP_FACTORY = None
+
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# Returned by make_request when a conditional request is answered with 304 Not Modified
+NOT_MODIFIED = object()
+
+# Target companies are scraped directly, so their LinkedIn postings are skipped
+LINKEDIN_EXCLUDED_COMPANIES = frozenset({'Apple', 'Microsoft', 'Google', 'Meta', 'Nvidia', 'Spotify', 'Palantir'})
+
+# More flexible internship detection for LinkedIn titles
+INTERNSHIP_KEYWORDS = (
+    'intern', 'internship', 'trainee', 'graduate', 
+    'entry level', 'junior', 'student', 'placement',
+    'apprentice', 'stage', 'praktikum', 'stagiaire'  # EU language variants
+)
+
+@dataclass(slots=True, frozen=True)
 class InternshipListing:
-    """Data structure for internship listings"""
-    company: str
-    title: str
-    location: str
+    """Data structure for internship listings, equal and hashed by URL alone"""
+    company: str = field(compare=False)
+    title: str = field(compare=False)
+    location: str = field(compare=False)
     url: str
-    posted_date: Optional[str] = None
+    posted_date: Optional[str] = field(default=None, compare=False)
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 16-byte digests, stored as a plain bit array"""
+    
+    def __init__(self, capacity: int, error_rate: float, bits: Optional[bytes] = None):
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+        if len(self.bits) != (self.size + 7) // 8:
+            raise ValueError("Bloom filter bits don't match its capacity and error rate")
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        """Bit positions for a digest via double hashing of its two 64-bit halves"""
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, digest: bytes):
+        """Add a digest to the filter"""
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+# CSS selectors for the HTML careers pages
+_GOOGLE_CARD = 'div[data-job-id]'
+_GOOGLE_TITLE = ('h3', 'a[data-gtm-event-name="job-click"]')
+_GOOGLE_LOCATION = 'span.job-location'
+_GOOGLE_LINK = 'a[href]'
+
+_META_CARD = 'div[data-testid="job-card"]'
+_META_CARD_LINK = 'a.job-card'
+_META_TITLE = ('h3', 'div.job-title')
+_META_LOCATION = ('span.location', 'div.job-location')
+_META_LINK = 'a'
+
+_SPOTIFY_CARDS = ('div.job-card', 'a.job-link', 'div[data-testid="job-listing"]', 'li.job-item')
+_SPOTIFY_ANY_LINK = 'a[href]'
+_SPOTIFY_TITLE = ('h3', 'h2', 'h4', 'span.title', 'div.title')
+_SPOTIFY_LOCATION = ('span.location', 'div.location', 'p.location')
+_SPOTIFY_LINK = 'a'
+
+def _select_first(node, selectors):
+    """First match of the first selector that matches anything, in order of preference"""
+    for selector in selectors:
+        match = node.css_first(selector)
+        if match is not None:
+            return match
+    return None
+
+def _href(node) -> str:
+    """A link's href, empty when it is missing or has no value"""
+    return node.attributes.get('href') or ''
+
+# HTML page parsers. They are module-level so they can run in worker processes, and
+# return plain dicts of raw title/location/url fields; filtering stays in the scrapers.
+
+def parse_google_jobs(html: str) -> List[dict]:
+    """Extract job fields from Google's careers results page"""
+    jobs = []
+    tree = LexborHTMLParser(html)
+    
+    for card in tree.css(_GOOGLE_CARD):
+        title_elem = _select_first(card, _GOOGLE_TITLE)
+        location_elem = card.css_first(_GOOGLE_LOCATION)
+        link_elem = card.css_first(_GOOGLE_LINK)
+        
+        if title_elem and location_elem and link_elem:
+            jobs.append({
+                'title': title_elem.text(strip=True),
+                'location': location_elem.text(strip=True),
+                'url': urljoin('https://www.google.com', _href(link_elem))
+            })
+            
+    return jobs
+
+def parse_meta_jobs(html: str) -> List[dict]:
+    """Extract job fields from Meta's careers jobs page"""
+    jobs = []
+    tree = LexborHTMLParser(html)
+    job_cards = tree.css(_META_CARD) or tree.css(_META_CARD_LINK)
+    
+    for card in job_cards:
+        title_elem = _select_first(card, _META_TITLE)
+        location_elem = _select_first(card, _META_LOCATION)
+        link_elem = card if card.tag == 'a' else card.css_first(_META_LINK)
+        
+        if title_elem and link_elem:
+            # Only links to a job page count
+            href = _href(link_elem)
+            if '/jobs/' not in href:
+                continue
+                
+            jobs.append({
+                'title': title_elem.text(strip=True),
+                'location': location_elem.text(strip=True) if location_elem else 'London, UK',
+                'url': urljoin('https://www.metacareers.com', href)
+            })
+            
+    return jobs
+
+def parse_spotify_jobs(html: str) -> List[dict]:
+    """Extract job fields from Spotify's students page"""
+    jobs = []
+    tree = LexborHTMLParser(html)
+    
+    # Look for job cards or listing containers
+    job_cards = []
+    for selector in _SPOTIFY_CARDS:
+        job_cards = tree.css(selector)
+        if job_cards:
+            break
+    
+    # If no specific job cards, look for any links with job-related patterns
+    if not job_cards:
+        job_cards = [card for card in tree.css(_SPOTIFY_ANY_LINK) if 
+                   ('job' in _href(card).lower() or 
+                    'career' in _href(card).lower() or
+                    'intern' in card.text().lower())]
+    
+    for card in job_cards:
+        # Extract title from various possible elements
+        title_elem = _select_first(card, _SPOTIFY_TITLE)
+        
+        if not title_elem and card.tag == 'a':
+            title_elem = card
+        
+        # Extract location
+        location_elem = _select_first(card, _SPOTIFY_LOCATION)
+        
+        if title_elem:
+            # Get URL
+            if card.tag == 'a':
+                url = urljoin('https://www.lifeatspotify.com', _href(card))
+            else:
+                link_elem = card.css_first(_SPOTIFY_LINK)
+                url = urljoin('https://www.lifeatspotify.com', _href(link_elem)) if link_elem else ''
+                
+            jobs.append({
+                'title': title_elem.text(strip=True),
+                'location': location_elem.text(strip=True) if location_elem else '',
+                'url': url
+            })
+            
+    return jobs
+
+def ttl_cached(scraper):
+    """Reuse a scraper's listings for scrape_cache_ttl seconds, across runs via the HTTP cache file"""
+    @functools.wraps(scraper)
+    async def wrapper(self) -> List[InternshipListing]:
+        ttl = self.config['scrape_cache_ttl']
+        if ttl <= 0:
+            return await scraper(self)
+            
+        # Entries record when they were scraped, so a changed TTL applies to them too
+        memo = self._http_cache.setdefault('memo', {})
+        entry = memo.get(scraper.__name__)
+        age = time.time() - entry['scraped_at'] if entry and 'scraped_at' in entry else None
+        if age is not None and 0 <= age < ttl:
+            self.logger.info(f"Reusing listings from {scraper.__name__} scraped {age:.0f}s ago")
+            return [InternshipListing(**listing) for listing in entry['listings']]
+            
+        internships = await scraper(self)
+        
+        # Scrapers come back empty when their requests give up, so an empty result isn't kept
+        if internships:
+            memo[scraper.__name__] = {
+                'scraped_at': time.time(),
+                'listings': [asdict(internship) for internship in internships]
+            }
+        return internships
+    return wrapper
 
 class InternshipMonitor:
     """Main class for monitoring internship opportunities"""
     
+    # Tokens of lowercased title/location text, matching how single-word keywords are written
+    _TOKEN_RE = re.compile(r"[a-z0-9+#./-]+")
+    
+    # Size in bytes of each listing digest
+    SEEN_DIGEST_SIZE = 16
+    
+    # Sizing of the seen-listings Bloom filter (~180 KB on disk); a false positive
+    # means an occasional new listing is taken as already reported
+    SEEN_CAPACITY = 100_000
+    SEEN_ERROR_RATE = 1e-3
+    
+    # Maximum number of requests in flight to any one host
+    HOST_CONCURRENCY = 2
+    
+    # Hosts that throttle aggressively; requests to them start at least rate_limit_delay apart.
+    # LinkedIn goes through jobpilot and is paced by its own limiter
+    PACED_HOSTS = frozenset({'www.google.com'})
+    
+    # Response statuses worth retrying: rate limiting and transient server errors
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    # Upper bound of the random jitter added to each retry delay, in seconds
+    RETRY_JITTER = 0.5
+    
+    # Upper bound on pages fetched from a paginated jobs API in one scrape
+    API_MAX_PAGES = 25
+    
+    # Decoded pages at least this many characters long are parsed in a worker process
+    # instead of on the event loop
+    PARSE_IN_PROCESS_MIN_CHARS = 256 * 1024
+    
+    # Apple job row fields, matched by the streaming parser
+    _APPLE_TITLE_XPATH = etree.XPath(
+        ".//a[contains(concat(' ', normalize-space(@class), ' '), ' table--advanced-search__title ')]"
+    )
+    _APPLE_LOCATION_XPATH = etree.XPath(".//td[@data-table-col-name='locations']")
+    
+    # One report line per listing, given its escaped title, location suffix and URL
+    _LISTING_LINE = "  • {0}{1} \\- [Apply]({2})".format
+    
+    # Characters Telegram's MarkdownV2 requires escaped in text, and inside link URLs
+    _MD_SPECIAL_RE = re.compile(r"([_*\[\]()~`>#+\-=|{}.!\\])")
+    _MD_URL_SPECIAL_RE = re.compile(r"([)\\])")
+    
     def __init__(self):
         self.setup_logging()
         self.load_config()
-        self.session = self.create_session()
+        self.session = None  # aiohttp session, opened per run inside the event loop
         self.internships = []
         
+        # Listings already reported in earlier runs
+        self._seen = self._load_seen(self.config['seen_file'])
+        self._seen_changed = False
+        
+        # Per-source HTTP validators and the listings parsed from that response
+        self._http_cache = self._load_http_cache(self.config['http_cache_file'])
+        self._pending_validators = {}
+        
+        # Worker processes for parsing large pages, available while collecting
+        self._parse_pool = None
+        
+        # Scraping functions for target companies, plus LinkedIn
+        self._scrapers = (
+            self.scrape_apple_careers,
+            self.scrape_microsoft_careers,
+            self.scrape_google_careers,
+            self.scrape_meta_careers,
+            self.scrape_nvidia_careers,
+            self.scrape_spotify_careers,
+            self.scrape_palantir_careers,
+            self.search_linkedin_jobs
+        )
+        
         # User agents for rotation
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -55,6 +327,14 @@ class InternshipMonitor:
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0"
         ]
         
+        # User agent picked for each host, kept for the whole run
+        self._ua_by_host: Dict[str, str] = {}
+        
+        # Per-host request slots, and pacing state for PACED_HOSTS
+        self._host_sems: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.HOST_CONCURRENCY))
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_next_request: Dict[str, float] = {}
+        
         # EU and UK location keywords for filtering - comprehensive coverage
         self.target_locations = [
             'london', 'dublin', 'berlin', 'munich', 'amsterdam', 'paris', 'madrid', 'barcelona',
@@ -81,6 +361,18 @@ class InternshipMonitor:
             'gcp', 'microservices', 'agile', 'scrum', 'git', 'github', 'gitlab', 'ci/cd',
             'selenium', 'testing', 'qa', 'quality assurance', 'automation', 'linux', 'unix'
         ]
+        
+        # Precompiled keyword alternations - one regex scan per check instead of a Python loop
+        self._loc_re = self._compile_keywords(self.target_locations)
+        self._swe_re = self._compile_keywords(self.swe_keywords)
+        
+        # Single-token keywords, checked by hash lookup before falling back to the regex scan
+        self._loc_tokens = frozenset(k for k in self.target_locations if self._TOKEN_RE.fullmatch(k))
+        self._swe_tokens = frozenset(k for k in self.swe_keywords if self._TOKEN_RE.fullmatch(k))
+        
+        # Titles and locations repeat across cards and scrapers, so memoize the matches per instance
+        self._match_location = functools.lru_cache(maxsize=8192)(self._match_location)
+        self._match_swe = functools.lru_cache(maxsize=8192)(self._match_swe)
 
     def setup_logging(self):
         """Configure logging for the application"""
@@ -101,745 +393,875 @@ class InternshipMonitor:
             'telegram_chat_id': os.getenv('TELEGRAM_CHAT_ID'),
             'request_timeout': int(os.getenv('REQUEST_TIMEOUT', '30')),
             'rate_limit_delay': float(os.getenv('RATE_LIMIT_DELAY', '2.0')),
-            'max_retries': int(os.getenv('MAX_RETRIES', '3'))
+            'max_retries': int(os.getenv('MAX_RETRIES', '3')),
+            'cache_dir': os.path.expanduser(os.getenv('CACHE_DIR', '~/.cache/intern-tel-bot')),
+            'scrape_cache_ttl': int(os.getenv('SCRAPE_CACHE_TTL', '900')),
+            'linkedin_concurrency': int(os.getenv('LINKEDIN_CONCURRENCY', '10'))
         }
+        self.config['seen_file'] = os.getenv('SEEN_FILE', os.path.join(self.config['cache_dir'], 'seen.bloom'))
+        self.config['http_cache_file'] = os.getenv('HTTP_CACHE_FILE', os.path.join(self.config['cache_dir'], 'http.json.zst'))
         
         # Validate required configuration
         if not self.config['telegram_bot_token']:
             raise ValueError("TELEGRAM_BOT_TOKEN is required")
         if not self.config['telegram_chat_id']:
             raise ValueError("TELEGRAM_CHAT_ID is required")
+        if self.config['linkedin_concurrency'] < 1:
+            raise ValueError("LINKEDIN_CONCURRENCY must be at least 1")
             
         self.logger.info("Configuration loaded successfully")
 
-    def create_session(self):
-        """Create HTTP session with proper headers and timeout"""
-        session = requests.Session()
-        session.headers.update({
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        return session
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create HTTP session with proper headers and timeout (must be called inside the event loop)"""
+        return aiohttp.ClientSession(
+            # Pooled keep-alive connections so repeat requests to a host skip the TCP+TLS handshake;
+            # DNS goes through the non-blocking aiodns resolver and is cached for the whole run.
+            # limit is the global cap on concurrent requests across all scrapers
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=4,
+                keepalive_timeout=60,
+                resolver=aiohttp.AsyncResolver(),
+                ttl_dns_cache=3600
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.config['request_timeout']),
+            headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            }
+        )
+
+    def _load_seen(self, path: str) -> BloomFilter:
+        """Load the Bloom filter of previously reported listings"""
+        try:
+            with open(path, 'rb') as f:
+                return BloomFilter(self.SEEN_CAPACITY, self.SEEN_ERROR_RATE, f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable seen filter {path}: {e}")
+            
+        return BloomFilter(self.SEEN_CAPACITY, self.SEEN_ERROR_RATE)
+
+    def _listing_digest(self, internship: InternshipListing) -> bytes:
+        """Stable digest identifying a listing across runs"""
+        key = f"{internship.company}\x00{internship.url}".encode()
+        return hashlib.blake2b(key, digest_size=self.SEEN_DIGEST_SIZE).digest()
+
+    def filter_new_internships(self, internships: Iterable[InternshipListing]) -> List[InternshipListing]:
+        """Drop listings reported in earlier runs and remember the rest"""
+        new_internships = []
+        for internship in internships:
+            digest = self._listing_digest(internship)
+            if digest in self._seen:
+                continue
+            self._seen.add(digest)
+            self._seen_changed = True
+            new_internships.append(internship)
+            
+        return new_internships
+
+    def save_seen(self):
+        """Write the seen filter back to disk if listings were added"""
+        if not self._seen_changed:
+            return
+            
+        path = self.config['seen_file']
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        
+        # Write a temporary file and swap it in so a crash can't leave a truncated filter
+        with open(path + '.tmp', 'wb') as f:
+            f.write(self._seen.bits)
+        os.replace(path + '.tmp', path)
+        self._seen_changed = False
+
+    def _load_http_cache(self, path: str) -> dict:
+        """Load cached HTTP validators and listings from the previous run (zstd-compressed JSON)"""
+        try:
+            with open(path, 'rb') as f:
+                return orjson.loads(zstd.ZstdDecompressor().decompress(f.read()))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, zstd.ZstdError) as e:
+            self.logger.warning(f"Ignoring unreadable HTTP cache {path}: {e}")
+            return {}
+
+    def save_http_cache(self):
+        """Persist HTTP validators and listings for the next run"""
+        path = self.config['http_cache_file']
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(zstd.ZstdCompressor(level=3).compress(orjson.dumps(self._http_cache)))
+        os.replace(path + '.tmp', path)
+
+    def cache_listings(self, cache_key: str, internships: List[InternshipListing]):
+        """Remember listings parsed from a response that carried ETag/Last-Modified"""
+        validators = self._pending_validators.pop(cache_key, None)
+        if validators:
+            self._http_cache[cache_key] = {
+                **validators,
+                'listings': [asdict(internship) for internship in internships]
+            }
+
+    def cached_listings(self, cache_key: str) -> List[InternshipListing]:
+        """Listings parsed from the last full response for a source"""
+        entry = self._http_cache.get(cache_key, {})
+        return [InternshipListing(**listing) for listing in entry.get('listings', [])]
 
     def get_random_user_agent(self):
         """Get a random user agent for request rotation"""
         return random.choice(self.user_agents)
 
-    def make_request(self, url: str, retries: int = None, params: dict = None) -> Optional[requests.Response]:
-        """Make HTTP request with error handling and retries"""
+    def get_user_agent(self, url: str) -> str:
+        """Get the user agent for a URL's host, choosing one at random on first contact"""
+        host = urlparse(url).netloc
+        user_agent = self._ua_by_host.get(host)
+        if user_agent is None:
+            user_agent = self._ua_by_host[host] = self.get_random_user_agent()
+        return user_agent
+
+    async def make_request(self, url: str, retries: int = None, params: Any = None,
+                           payload: Any = None, as_json: bool = False, stream: bool = False,
+                           cache_key: str = None) -> Optional[Any]:
+        """Make HTTP request with error handling and retries, returning the response body
+        
+        The request is a POST with a JSON body when payload is given, otherwise a GET.
+        With as_json the decoded JSON document is returned instead of the text. With
+        stream the unread response is returned; the caller must release it with
+        `async with response:` after reading response.content.
+        
+        With cache_key the request is conditional on the validators stored for that
+        source, and NOT_MODIFIED is returned on 304; pass the parsed result to
+        cache_listings so it can be reused next time.
+        """
         if retries is None:
             retries = self.config['max_retries']
             
-        self.session.headers.update({'User-Agent': self.get_random_user_agent()})
+        host = urlparse(url).netloc
+        
+        # Per-request header; scrapers run concurrently, so the shared session defaults stay untouched
+        headers = {'User-Agent': self.get_user_agent(url)}
+        if as_json:
+            headers['Accept'] = 'application/json'
+            
+        cached = self._http_cache.get(cache_key) if cache_key else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
         for attempt in range(retries + 1):
             try:
-                response = self.session.get(
-                    url, 
-                    params=params,
-                    timeout=self.config['request_timeout'],
-                    allow_redirects=True
-                )
-                response.raise_for_status()
-                return response
+                # Limit parallel requests to each host to stay polite
+                async with self._host_sems[host]:
+                    method = 'POST' if payload is not None else 'GET'
+                    if host in self.PACED_HOSTS:
+                        await self._pace_host(host)
+                    response = await self.session.request(method, url, params=params, json=payload,
+                                                          headers=headers, allow_redirects=True)
+                    if cached and response.status == 304:
+                        response.release()
+                        return NOT_MODIFIED
+                    
+                    if cache_key and response.ok:
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        if etag or last_modified:
+                            self._pending_validators[cache_key] = {'etag': etag, 'last_modified': last_modified}
+                        
+                    if stream and response.ok:
+                        return response
+                    
+                    async with response:
+                        response.raise_for_status()
+                        if as_json:
+                            return orjson.loads(await response.read())
+                        return await response.text()
                 
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 self.logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
+                
+                # Client errors like 404 won't change on a retry
+                if isinstance(e, aiohttp.ClientResponseError) and e.status not in self.RETRY_STATUSES:
+                    break
                 if attempt < retries:
-                    time.sleep(self.config['rate_limit_delay'] * (attempt + 1))
+                    await asyncio.sleep(self.retry_delay(attempt, e))
                     
-        self.logger.error(f"Failed to fetch {url} after {retries + 1} attempts")
+        self.logger.error(f"Failed to fetch {url} after {attempt + 1} attempts")
         return None
 
+    async def conditional_get(self, cache_key: str, url: str,
+                              **kwargs) -> Tuple[Optional[Any], Optional[List[InternshipListing]]]:
+        """Fetch url conditionally on the validators cached under cache_key
+        
+        Returns (body, None) for a fresh response, to be parsed and handed to
+        cache_listings, or (None, listings) with the cached listings on a 304.
+        """
+        response = await self.make_request(url, cache_key=cache_key, **kwargs)
+        if response is NOT_MODIFIED:
+            self.logger.info(f"{cache_key.capitalize()} careers unchanged, reusing cached listings")
+            return None, self.cached_listings(cache_key)
+        return response, None
+
+    async def _pace_host(self, host: str):
+        """Wait until rate_limit_delay has passed since the previous request to host started"""
+        async with self._host_locks[host]:
+            loop = asyncio.get_running_loop()
+            wait = self._host_next_request.get(host, 0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_next_request[host] = loop.time() + self.config['rate_limit_delay']
+
+    def retry_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, honouring a numeric Retry-After header"""
+        delay = self.config['rate_limit_delay'] * (2 ** attempt) + random.uniform(0, self.RETRY_JITTER)
+        
+        # Retry-After is capped at the request timeout; sleeping isn't covered by the session
+        # timeout, so an hour-long Retry-After would otherwise stall the whole run
+        retry_after = getattr(error, 'headers', None) and error.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.config['request_timeout']))
+        return delay
+
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> re.Pattern:
+        """Compile keywords into a single alternation matching any of them as a substring"""
+        return re.compile('|'.join(map(re.escape, keywords)))
+
+    def _match_keywords(self, text: str, tokens: frozenset, pattern: re.Pattern) -> bool:
+        """Match text by whole-token lookup first, then by substring for phrases and word parts"""
+        lowered = text.lower()
+        return not tokens.isdisjoint(self._TOKEN_RE.findall(lowered)) or bool(pattern.search(lowered))
+
+    def _match_location(self, location: str) -> bool:
+        """Match location text against the EU/UK keywords (memoized in __init__)"""
+        return self._match_keywords(location, self._loc_tokens, self._loc_re)
+
+    def _match_swe(self, text: str) -> bool:
+        """Match role text against the SWE keywords (memoized in __init__)"""
+        return self._match_keywords(text, self._swe_tokens, self._swe_re)
+
     def is_target_location(self, location: str) -> bool:
         """Check if location matches EU/UK criteria"""
         if not location:
             return False
             
-        location_lower = location.lower()
-        return any(keyword in location_lower for keyword in self.target_locations)
+        return self._match_location(location)
 
     def is_swe_role(self, title: str, description: str = "") -> bool:
         """Check if role is software engineering related"""
         if not title:
             return False
             
-        text_to_check = f"{title} {description}".lower()
-        return any(keyword in text_to_check for keyword in self.swe_keywords)
+        return self._match_swe(f"{title} {description}" if description else title)
 
-    def scrape_apple_careers(self) -> List[InternshipListing]:
-        """Scrape Apple careers page for internships"""
-        internships = []
-        self.logger.info("Scraping Apple careers...")
-        
-        try:
-            # Apple careers search URL with EU/UK locations and internship filter
-            search_url = "https://jobs.apple.com/cs-cz/search"
-            params = {
-                'search': 'software engineer',
-                'sort': 'relevance',
-                'location': 'united-kingdom-GBR+czechia-CZE+germany-DEU+ireland-IRL+france-FRA+italy-ITA+spain-ESP+netherlands-NLD+sweden-SWE+denmark-DNK+norway-NOR+finland-FIN+belgium-BEL+austria-AUT+switzerland-CHE+poland-POL',
-                'team': 'internships-STDNT-INTRN'
-            }
-            
-            response = self.make_request(search_url, params=params)
-            if not response:
-                return internships
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('tr', {'data-job-id': True})
-            
-            for card in job_cards:
-                title_elem = card.find('a', class_='table--advanced-search__title')
-                location_elem = card.find('td', {'data-table-col-name': 'locations'})
+    @staticmethod
+    def _element_text(element) -> str:
+        """Concatenate stripped text of an element, like the HTML parsers' text(strip=True)"""
+        return ''.join(text.strip() for text in element.itertext())
+
+    def _iter_apple_rows(self, parser) -> Iterator[InternshipListing]:
+        """Yield Apple listings from rows the pull parser has finished, then free them"""
+        for _, row in parser.read_events():
+            if row.get('data-job-id') is not None:
+                title_elems = self._APPLE_TITLE_XPATH(row)
+                location_elems = self._APPLE_LOCATION_XPATH(row)
                 
-                if title_elem and location_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    url = urljoin('https://jobs.apple.com', title_elem['href'])
+                if title_elems and location_elems:
+                    title = self._element_text(title_elems[0])
+                    location = self._element_text(location_elems[0])
+                    url = urljoin('https://jobs.apple.com', title_elems[0].get('href', ''))
                     
                     if self.is_swe_role(title):
-                        internships.append(InternshipListing(
+                        yield InternshipListing(
                             company="Apple",
                             title=title,
                             location=location,
                             url=url
-                        ))
-                    
-        except Exception as e:
-            self.logger.error(f"Error scraping Apple careers: {e}")
+                        )
+                        
+            # Drop the finished row and anything before it so only one row stays in memory
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+    async def parse_html(self, parser, html: str) -> List[dict]:
+        """Run a page parser, in a worker process when the page is large enough to be worth it"""
+        if self._parse_pool is not None and len(html) >= self.PARSE_IN_PROCESS_MIN_CHARS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._parse_pool, parser, html)
+        return parser(html)
+
+    @ttl_cached
+    async def scrape_apple_careers(self) -> List[InternshipListing]:
+        """Scrape Apple careers page for internships"""
+        internships = []
+        self.logger.info("Scraping Apple careers...")
+        
+        # Apple careers search URL with EU/UK locations and internship filter
+        search_url = "https://jobs.apple.com/cs-cz/search"
+        params = {
+            'search': 'software engineer',
+            'sort': 'relevance',
+            'location': 'united-kingdom-GBR+czechia-CZE+germany-DEU+ireland-IRL+france-FRA+italy-ITA+spain-ESP+netherlands-NLD+sweden-SWE+denmark-DNK+norway-NOR+finland-FIN+belgium-BEL+austria-AUT+switzerland-CHE+poland-POL',
+            'team': 'internships-STDNT-INTRN'
+        }
+        
+        response, cached = await self.conditional_get('apple', search_url, params=params, stream=True)
+        if cached is not None:
+            return cached
+        if not response:
+            return internships
             
+        # Parse the page as it downloads, handling each job row as soon as it is complete
+        parser = etree.HTMLPullParser(events=('end',), tag='tr')
+        async with response:
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                parser.feed(chunk)
+                internships.extend(self._iter_apple_rows(parser))
+        parser.close()
+        internships.extend(self._iter_apple_rows(parser))
+        self.cache_listings('apple', internships)
+        
         self.logger.info(f"Found {len(internships)} Apple internships")
         return internships
 
-    def scrape_microsoft_careers(self) -> List[InternshipListing]:
-        """Scrape Microsoft careers page for internships"""
+    @ttl_cached
+    async def scrape_microsoft_careers(self) -> List[InternshipListing]:
+        """Scrape Microsoft careers search API for internships"""
         internships = []
         self.logger.info("Scraping Microsoft careers...")
         
-        try:
-            # Microsoft careers API
-            api_url = "https://careers.microsoft.com/professionals/us/en/search-results"
-            params = {
-                'keywords': 'intern',
-                'location': 'Europe',
-                'rt': 'university'
-            }
-            
-            response = self.make_request(api_url, params=params)
-            if not response:
-                return internships
+        # Microsoft careers search API (JSON behind careers.microsoft.com), one lc facet per country
+        api_url = "https://gcsservices.careers.microsoft.com/search/api/v1/search"
+        locations = [
+            'United Kingdom', 'Ireland', 'Germany', 'France', 'Netherlands', 'Sweden', 'Denmark', 'Norway',
+            'Finland', 'Belgium', 'Austria', 'Switzerland', 'Poland', 'Spain', 'Italy', 'Czech Republic'
+        ]
+        page_size = 20
+        params = [
+            ('q', 'intern'),
+            ('l', 'en_us'),
+            ('exp', 'Students and graduates'),
+            ('pgSz', str(page_size)),
+            ('o', 'Relevance'),
+            ('flt', 'true'),
+            *(('lc', location) for location in locations)
+        ]
+        
+        # Page through the results; the total is reported with every page
+        for page in range(1, self.API_MAX_PAGES + 1):
+            data = await self.make_request(api_url, params=[*params, ('pg', str(page))], as_json=True)
+            if not data:
+                break
                 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', {'data-ph-at-id': 'job-result-item'})
+            result = data.get('operationResult', {}).get('result', {})
+            jobs = result.get('jobs', [])
             
-            for card in job_cards:
-                title_elem = card.find('a', {'data-ph-at-id': 'job-result-title'})
-                location_elem = card.find('span', {'data-ph-at-id': 'job-result-location'})
+            for job in jobs:
+                title = job.get('title', '')
+                properties = job.get('properties', {})
+                location = properties.get('primaryLocation') or ', '.join(properties.get('locations', []))
+                url = f"https://jobs.careers.microsoft.com/global/en/job/{job.get('jobId')}"
                 
-                if title_elem and location_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    url = urljoin('https://careers.microsoft.com', title_elem['href'])
+                if (job.get('jobId') and
+                    self.is_target_location(location) and 
+                    self.is_swe_role(title)):
                     
-                    if (self.is_target_location(location) and 
-                        self.is_swe_role(title)):
-                        
-                        internships.append(InternshipListing(
-                            company="Microsoft",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                        
-        except Exception as e:
-            self.logger.error(f"Error scraping Microsoft careers: {e}")
-            
+                    internships.append(InternshipListing(
+                        company="Microsoft",
+                        title=title,
+                        location=location,
+                        url=url,
+                        posted_date=job.get('postingDate')
+                    ))
+                    
+            if not jobs or page * page_size >= result.get('totalJobs', 0):
+                break
+        
         self.logger.info(f"Found {len(internships)} Microsoft internships")
         return internships
 
-    def scrape_google_careers(self) -> List[InternshipListing]:
+    @ttl_cached
+    async def scrape_google_careers(self) -> List[InternshipListing]:
         """Scrape Google careers page for internships"""
         internships = []
         self.logger.info("Scraping Google careers...")
         
-        try:
-            # Google careers search URL with specific parameters
-            search_url = "https://www.google.com/about/careers/applications/jobs/results/"
-            params = {
-                'company': ['Fitbit', 'Google', 'YouTube'],
-                'distance': '50',
-                'employment_type': 'INTERN',
-                'location': ['United Kingdom', 'Ireland', 'Germany', 'France', 'Netherlands', 'Sweden', 'Denmark', 'Norway', 'Finland', 'Belgium', 'Austria', 'Switzerland', 'Poland', 'Spain', 'Italy', 'Czech Republic']
-            }
-            
-            # Build URL with multiple location and company parameters
-            url_params = []
-            for company in params['company']:
-                url_params.append(f"company={company}")
-            for location in params['location']:
-                url_params.append(f"location={location}")
-            url_params.extend([
-                f"distance={params['distance']}",
-                f"employment_type={params['employment_type']}"
-            ])
-            
-            full_url = f"{search_url}?{'&'.join(url_params)}"
-            response = self.make_request(full_url)
-            if not response:
-                return internships
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', {'data-job-id': True})
+        # Google careers search URL with specific parameters
+        search_url = "https://www.google.com/about/careers/applications/jobs/results/"
+        params = {
+            'company': ['Fitbit', 'Google', 'YouTube'],
+            'distance': '50',
+            'employment_type': 'INTERN',
+            'location': ['United Kingdom', 'Ireland', 'Germany', 'France', 'Netherlands', 'Sweden', 'Denmark', 'Norway', 'Finland', 'Belgium', 'Austria', 'Switzerland', 'Poland', 'Spain', 'Italy', 'Czech Republic']
+        }
+        
+        # Build URL with multiple location and company parameters
+        url_params = []
+        for company in params['company']:
+            url_params.append(f"company={company}")
+        for location in params['location']:
+            url_params.append(f"location={location}")
+        url_params.extend([
+            f"distance={params['distance']}",
+            f"employment_type={params['employment_type']}"
+        ])
+        
+        full_url = f"{search_url}?{'&'.join(url_params)}"
+        html, cached = await self.conditional_get('google', full_url)
+        if cached is not None:
+            return cached
+        if not html:
+            return internships
             
-            for card in job_cards:
-                title_elem = card.find('h3') or card.find('a', {'data-gtm-event-name': 'job-click'})
-                location_elem = card.find('span', class_='job-location')
-                link_elem = card.find('a', href=True)
-                
-                if title_elem and location_elem and link_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    url = urljoin('https://www.google.com', link_elem['href'])
+        for job in await self.parse_html(parse_google_jobs, html):
+            if self.is_swe_role(job['title']):
+                internships.append(InternshipListing(company="Google", **job))
                     
-                    if self.is_swe_role(title):
-                        internships.append(InternshipListing(
-                            company="Google",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                    
-        except Exception as e:
-            self.logger.error(f"Error scraping Google careers: {e}")
-            
+        self.cache_listings('google', internships)
+        
         self.logger.info(f"Found {len(internships)} Google internships")
         return internships
 
-    def scrape_meta_careers(self) -> List[InternshipListing]:
+    @ttl_cached
+    async def scrape_meta_careers(self) -> List[InternshipListing]:
         """Scrape Meta careers page for internships"""
         internships = []
         self.logger.info("Scraping Meta careers...")
         
-        try:
-            # Meta careers URL with specific university teams and UK office
-            search_url = "https://www.metacareers.com/jobs"
-            params = {
-                'teams[0]': 'University Grad - Business',
-                'teams[1]': 'University Grad - Engineering, Tech & Design', 
-                'teams[2]': 'University Grad - PhD & Postdoc',
-                'offices[0]': 'London, UK'
-            }
-            
-            response = self.make_request(search_url, params=params)
-            if not response:
-                return internships
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_cards = soup.find_all('div', {'data-testid': 'job-card'}) or soup.find_all('a', class_='job-card')
+        # Meta careers URL with specific university teams and UK office
+        search_url = "https://www.metacareers.com/jobs"
+        params = {
+            'teams[0]': 'University Grad - Business',
+            'teams[1]': 'University Grad - Engineering, Tech & Design', 
+            'teams[2]': 'University Grad - PhD & Postdoc',
+            'offices[0]': 'London, UK'
+        }
+        
+        html, cached = await self.conditional_get('meta', search_url, params=params)
+        if cached is not None:
+            return cached
+        if not html:
+            return internships
             
-            for card in job_cards:
-                title_elem = card.find('h3') or card.find('div', class_='job-title')
-                location_elem = card.find('span', class_='location') or card.find('div', class_='job-location')
-                link_elem = card if card.name == 'a' else card.find('a')
+        for job in await self.parse_html(parse_meta_jobs, html):
+            title = job['title']
+            if ('intern' in title.lower() or 'university' in title.lower()) and self.is_swe_role(title):
+                internships.append(InternshipListing(company="Meta", **job))
                 
-                if title_elem and link_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True) if location_elem else 'London, UK'
-                    
-                    # Extract job ID from href
-                    href = link_elem.get('href', '')
-                    if '/jobs/' in href:
-                        url = urljoin('https://www.metacareers.com', href)
-                    else:
-                        continue
-                    
-                    if ('intern' in title.lower() or 'university' in title.lower()) and self.is_swe_role(title):
-                        internships.append(InternshipListing(
-                            company="Meta",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                        
-        except Exception as e:
-            self.logger.error(f"Error scraping Meta careers: {e}")
-            
+        self.cache_listings('meta', internships)
+        
         self.logger.info(f"Found {len(internships)} Meta internships")
         return internships
 
-    def scrape_nvidia_careers(self) -> List[InternshipListing]:
-        """Scrape Nvidia careers page for internships"""
+    @ttl_cached
+    async def scrape_nvidia_careers(self) -> List[InternshipListing]:
+        """Scrape Nvidia Workday jobs API for internships"""
         internships = []
         self.logger.info("Scraping Nvidia careers...")
         
-        try:
-            # Nvidia careers search with job family group filter
-            search_url = "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite"
-            params = {
-                'jobFamilyGroup': '0c40f6bd1d8f10ae43ffbd1459047e84'  # From the provided URL
-            }
-            
-            response = self.make_request(search_url, params=params)
-            if not response:
-                return internships
+        # Workday jobs API behind the Nvidia career site
+        site_url = "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite"
+        api_url = "https://nvidia.wd5.myworkdayjobs.com/wday/cxs/nvidia/NVIDIAExternalCareerSite/jobs"
+        payload = {
+            'appliedFacets': {
+                'jobFamilyGroup': ['0c40f6bd1d8f10ae43ffbd1459047e84']  # From the provided URL
+            },
+            'searchText': 'intern',
+            'limit': 20,  # Workday's maximum page size
+            'offset': 0
+        }
+        
+        # Page through the results
+        total = None
+        for _ in range(self.API_MAX_PAGES):
+            data = await self.make_request(api_url, payload=payload, as_json=True)
+            if not data:
+                break
                 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for job listings in Workday format
-            job_cards = (soup.find_all('li', {'data-automation-id': 'jobListItem'}) or
-                        soup.find_all('div', class_='job-card') or
-                        soup.find_all('a', {'data-automation-id': 'jobTitle'}))
+            # Workday only reports the real total on the first page and 0 after that
+            postings = data.get('jobPostings', [])
+            if total is None:
+                total = data.get('total', 0)
             
-            for card in job_cards:
-                # Extract title
-                title_elem = (card.find('a', {'data-automation-id': 'jobTitle'}) or
-                             card.find('h3') or 
-                             card.find('span', {'data-automation-id': 'jobTitle'}))
+            for posting in postings:
+                title = posting.get('title', '')
+                location = posting.get('locationsText', '')
+                path = posting.get('externalPath', '')
+                url = f"{site_url}{path}" if path else ''
                 
-                # Extract location
-                location_elem = (card.find('span', {'data-automation-id': 'jobLocation'}) or
-                               card.find('div', class_='job-location'))
-                
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True) if location_elem else ''
+                # Filter for internships in EU/UK
+                if (('intern' in title.lower() or 'student' in title.lower()) and 
+                    self.is_swe_role(title) and
+                    self.is_target_location(location) and
+                    url):
                     
-                    # Get job URL
-                    if title_elem.name == 'a':
-                        url = urljoin('https://nvidia.wd5.myworkdayjobs.com', title_elem.get('href', ''))
-                    else:
-                        link_elem = card.find('a')
-                        url = urljoin('https://nvidia.wd5.myworkdayjobs.com', link_elem.get('href', '')) if link_elem else ''
+                    internships.append(InternshipListing(
+                        company="Nvidia",
+                        title=title,
+                        location=location,
+                        url=url,
+                        posted_date=posting.get('postedOn')
+                    ))
                     
-                    # Filter for internships in EU/UK
-                    if (('intern' in title.lower() or 'student' in title.lower()) and 
-                        self.is_swe_role(title) and
-                        self.is_target_location(location) and
-                        url):
-                        
-                        internships.append(InternshipListing(
-                            company="Nvidia",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                        
-        except Exception as e:
-            self.logger.error(f"Error scraping Nvidia careers: {e}")
-            
+            payload['offset'] += len(postings)
+            if not postings or payload['offset'] >= total:
+                break
+        
         self.logger.info(f"Found {len(internships)} Nvidia internships")
         return internships
 
-    def scrape_spotify_careers(self) -> List[InternshipListing]:
+    @ttl_cached
+    async def scrape_spotify_careers(self) -> List[InternshipListing]:
         """Scrape Spotify careers page for internships"""
         internships = []
         self.logger.info("Scraping Spotify careers...")
         
-        try:
-            # Spotify students page
-            careers_url = "https://www.lifeatspotify.com/students"
-            response = self.make_request(careers_url)
-            if not response:
-                return internships
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+        # Spotify students page
+        careers_url = "https://www.lifeatspotify.com/students"
+        html, cached = await self.conditional_get('spotify', careers_url)
+        if cached is not None:
+            return cached
+        if not html:
+            return internships
             
-            # Look for job cards or listing containers
-            job_cards = (soup.find_all('div', class_='job-card') or 
-                        soup.find_all('a', class_='job-link') or
-                        soup.find_all('div', {'data-testid': 'job-listing'}) or
-                        soup.find_all('li', class_='job-item'))
+        for job in await self.parse_html(parse_spotify_jobs, html):
+            title = job['title']
             
-            # If no specific job cards, look for any links with job-related patterns
-            if not job_cards:
-                job_cards = soup.find_all('a', href=True)
-                job_cards = [card for card in job_cards if 
-                           ('job' in card.get('href', '').lower() or 
-                            'career' in card.get('href', '').lower() or
-                            'intern' in card.get_text().lower())]
-            
-            for card in job_cards:
-                # Extract title from various possible elements
-                title_elem = (card.find('h3') or card.find('h2') or card.find('h4') or 
-                             card.find('span', class_='title') or card.find('div', class_='title'))
-                
-                if not title_elem and card.name == 'a':
-                    title_elem = card
+            # Check if it's an internship and SWE role
+            if (('intern' in title.lower() or 'student' in title.lower()) and 
+                self.is_swe_role(title) and
+                job['url']):
                 
-                # Extract location
-                location_elem = (card.find('span', class_='location') or 
-                               card.find('div', class_='location') or
-                               card.find('p', class_='location'))
+                # Default to Stockholm if no location specified
+                internships.append(InternshipListing(
+                    company="Spotify",
+                    title=title,
+                    location=job['location'] or 'Stockholm, Sweden',
+                    url=job['url']
+                ))
                 
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True) if location_elem else ''
-                    
-                    # Get URL
-                    if card.name == 'a':
-                        url = urljoin('https://www.lifeatspotify.com', card.get('href', ''))
-                    else:
-                        link_elem = card.find('a')
-                        url = urljoin('https://www.lifeatspotify.com', link_elem.get('href', '')) if link_elem else ''
-                    
-                    # Check if it's an internship and SWE role
-                    if (('intern' in title.lower() or 'student' in title.lower()) and 
-                        self.is_swe_role(title) and
-                        url):
-                        
-                        # Default to Stockholm if no location specified
-                        if not location:
-                            location = 'Stockholm, Sweden'
-                            
-                        internships.append(InternshipListing(
-                            company="Spotify",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                    
-        except Exception as e:
-            self.logger.error(f"Error scraping Spotify careers: {e}")
-            
+        self.cache_listings('spotify', internships)
+        
         self.logger.info(f"Found {len(internships)} Spotify internships")
         return internships
 
-    def scrape_palantir_careers(self) -> List[InternshipListing]:
-        """Scrape Palantir careers page for internships"""
+    @ttl_cached
+    async def scrape_palantir_careers(self) -> List[InternshipListing]:
+        """Scrape Palantir Lever postings API for internships"""
         internships = []
         self.logger.info("Scraping Palantir careers...")
         
-        try:
-            # Palantir careers API
-            api_url = "https://jobs.lever.co/palantir"
-            response = self.make_request(api_url)
-            if not response:
-                return internships
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            job_postings = soup.find_all('div', class_='posting')
+        # Lever postings API behind jobs.lever.co/palantir
+        api_url = "https://api.lever.co/v0/postings/palantir"
+        postings, cached = await self.conditional_get('palantir', api_url, params={'mode': 'json'}, as_json=True)
+        if cached is not None:
+            return cached
+        if not postings:
+            return internships
             
-            for posting in job_postings:
-                title_elem = posting.find('h5')
-                location_elem = posting.find('span', class_='sort-by-location')
-                link_elem = posting.find('a')
-                
-                if title_elem and location_elem and link_elem:
-                    title = title_elem.get_text(strip=True)
-                    location = location_elem.get_text(strip=True)
-                    url = link_elem['href']
-                    
-                    if ('intern' in title.lower() and 
-                        self.is_target_location(location) and 
-                        self.is_swe_role(title)):
-                        
-                        internships.append(InternshipListing(
-                            company="Palantir",
-                            title=title,
-                            location=location,
-                            url=url
-                        ))
-                        
-        except Exception as e:
-            self.logger.error(f"Error scraping Palantir careers: {e}")
+        for posting in postings:
+            title = posting.get('text', '')
+            location = posting.get('categories', {}).get('location', '')
+            url = posting.get('hostedUrl', '')
             
+            if ('intern' in title.lower() and 
+                self.is_target_location(location) and 
+                self.is_swe_role(title) and
+                url):
+                
+                internships.append(InternshipListing(
+                    company="Palantir",
+                    title=title,
+                    location=location,
+                    url=url
+                ))
+                
+        self.cache_listings('palantir', internships)
+        
         self.logger.info(f"Found {len(internships)} Palantir internships")
         return internships
 
 
-    async def _search_linkedin_async(self) -> List[InternshipListing]:
-        """Async method to search LinkedIn using jobpilot library"""
+    async def search_linkedin_jobs(self) -> List[InternshipListing]:
+        """Search LinkedIn using jobpilot library for additional SWE internships"""
         internships = []
+        self.logger.info("Searching LinkedIn for internships using jobpilot...")
         
-        try:
-            # Enable jobpilot logging
-            jobpilot.enable_logging()
-            
-            # Initialize LinkedIn scraper
-            scraper = LinkedInScraper()
-            
-            # EU/UK locations to search - comprehensive coverage
-            locations = [
-                "United Kingdom", "Ireland", "Germany", "France", "Netherlands", 
-                "Sweden", "Denmark", "Norway", "Finland", "Switzerland",
-                "Austria", "Belgium", "Italy", "Spain", "Poland", "Czech Republic",
-                "Hungary", "Portugal", "Greece", "Romania", "Bulgaria", "Croatia",
-                "Slovakia", "Slovenia", "Estonia", "Latvia", "Lithuania", "Luxembourg",
-                "Malta", "Cyprus"
-            ]
-            
-            # Broader search keywords to catch various internship naming patterns
-            keywords = [
-                "software intern",
-                "developer intern", 
-                "engineering intern",
-                "tech intern",
-                "programming intern",
-                "backend intern",
-                "frontend intern",
-                "fullstack intern",
-                "python intern",
-                "java intern",
-                "javascript intern",
-                "react intern",
-                "node intern"
-            ]
-            
-            # Search for internships across different locations and keywords
-            # Limit searches to avoid rate limits: 8 locations × 4 keywords = 32 searches
-            for location in locations[:8]:  # First 8 EU countries for broad coverage
-                for keyword in keywords[:4]:  # Top 4 most effective keywords
-                    try:
-                        self.logger.info(f"Searching LinkedIn: {keyword} in {location}")
-                        
-                        # Create scraper input
-                        scraper_input = ScraperInput(
-                            location=location,
-                            keywords=keyword,
-                            limit=15
-                        )
-                        
-                        # Search jobs using jobpilot
-                        jobs = await scraper.scrape(scraper_input, job_details=False)
-                        
-                        for job in jobs:
-                            # Extract company name - job.company is a Company object with name attribute
-                            company = job.company.name if hasattr(job, 'company') and job.company else ''
-                            title = job.title if hasattr(job, 'title') else ''
-                            job_location = job.location if hasattr(job, 'location') else location
-                            
-                            # Extract URL from job object - jobpilot uses 'link' attribute
-                            url = job.link if hasattr(job, 'link') else ''
-                            
-                            # Filter out target companies (already scraped directly)
-                            excluded_companies = ['Apple', 'Microsoft', 'Google', 'Meta', 'Nvidia', 'Spotify', 'Palantir']
-                            
-                            # More flexible internship detection
-                            internship_keywords = [
-                                'intern', 'internship', 'trainee', 'graduate', 
-                                'entry level', 'junior', 'student', 'placement',
-                                'apprentice', 'stage', 'praktikum', 'stagiaire'  # EU language variants
-                            ]
-                            
-                            is_internship = any(keyword in title.lower() for keyword in internship_keywords)
-                            is_swe = self.is_swe_role(title)
-                            
-                            if (company not in excluded_companies and 
-                                is_swe and 
-                                is_internship and
-                                url):
-                                
-                                internships.append(InternshipListing(
-                                    company=company,
-                                    title=title,
-                                    location=job_location,
-                                    url=url
-                                ))
-                        
-                        # Rate limiting between searches
-                        await asyncio.sleep(self.config['rate_limit_delay'])
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Error searching LinkedIn for '{keyword}' in '{location}': {e}")
-                        continue
-                        
-        except Exception as e:
-            self.logger.error(f"Error in LinkedIn async search: {e}")
+        # Enable jobpilot logging
+        jobpilot.enable_logging()
+        
+        # Initialize LinkedIn scraper
+        scraper = LinkedInScraper()
+        
+        # EU/UK locations to search - comprehensive coverage
+        locations = [
+            "United Kingdom", "Ireland", "Germany", "France", "Netherlands", 
+            "Sweden", "Denmark", "Norway", "Finland", "Switzerland",
+            "Austria", "Belgium", "Italy", "Spain", "Poland", "Czech Republic",
+            "Hungary", "Portugal", "Greece", "Romania", "Bulgaria", "Croatia",
+            "Slovakia", "Slovenia", "Estonia", "Latvia", "Lithuania", "Luxembourg",
+            "Malta", "Cyprus"
+        ]
+        
+        # Broader search keywords to catch various internship naming patterns
+        keywords = [
+            "software intern",
+            "developer intern", 
+            "engineering intern",
+            "tech intern",
+            "programming intern",
+            "backend intern",
+            "frontend intern",
+            "fullstack intern",
+            "python intern",
+            "java intern",
+            "javascript intern",
+            "react intern",
+            "node intern"
+        ]
+        
+        # Search for internships across different locations and keywords
+        # Limit searches to avoid rate limits: 8 locations × 4 keywords = 32 searches
+        searches = [
+            (location, keyword)
+            for location in locations[:8]  # First 8 EU countries for broad coverage
+            for keyword in keywords[:4]  # Top 4 most effective keywords
+        ]
+        
+        # Run a few searches at once; the limiter keeps the overall pace at
+        # one search per rate_limit_delay on average, shared by all searches
+        concurrency = self.config['linkedin_concurrency']
+        delay = self.config['rate_limit_delay']
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AsyncLimiter(concurrency, concurrency * delay) if delay > 0 else contextlib.nullcontext()
+        
+        async def search(location: str, keyword: str) -> List[InternshipListing]:
+            async with semaphore, limiter:
+                self.logger.info(f"Searching LinkedIn: {keyword} in {location}")
+                
+                # Create scraper input
+                scraper_input = ScraperInput(
+                    location=location,
+                    keywords=keyword,
+                    limit=15
+                )
+                
+                # Search jobs using jobpilot; a stalled search gives up instead of holding its slot
+                jobs = await asyncio.wait_for(
+                    scraper.scrape(scraper_input, job_details=False),
+                    timeout=self.config['request_timeout']
+                )
             
+            found = []
+            for job in jobs:
+                # Extract company name - job.company is a Company object with name attribute
+                company = job.company.name if hasattr(job, 'company') and job.company else ''
+                title = job.title if hasattr(job, 'title') else ''
+                # jobpilot's location is a Location model; listings carry plain strings
+                job_location = str(job.location) if getattr(job, 'location', None) else location
+                
+                # Extract URL from job object - jobpilot uses 'link' attribute
+                url = job.link if hasattr(job, 'link') else ''
+                
+                is_internship = any(keyword in title.lower() for keyword in INTERNSHIP_KEYWORDS)
+                is_swe = self.is_swe_role(title)
+                
+                if (company not in LINKEDIN_EXCLUDED_COMPANIES and 
+                    is_swe and 
+                    is_internship and
+                    url):
+                    
+                    found.append(InternshipListing(
+                        company=company,
+                        title=title,
+                        location=job_location,
+                        url=url
+                    ))
+            return found
+        
+        results = await asyncio.gather(
+            *(search(location, keyword) for location, keyword in searches),
+            return_exceptions=True
+        )
+        
+        for (location, keyword), result in zip(searches, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning(
+                    f"LinkedIn search for '{keyword}' in '{location}' timed out after {self.config['request_timeout']}s"
+                )
+                continue
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Error searching LinkedIn for '{keyword}' in '{location}': {result!r}")
+                continue
+            internships.extend(result)
+        
+        # The same posting often turns up for several searches; collect_all_internships dedupes them
+        self.logger.info(f"Found {len(internships)} LinkedIn internships")
         return internships
 
-    def search_linkedin_jobs(self) -> List[InternshipListing]:
-        """Search LinkedIn using jobpilot library for additional SWE internships"""
-        self.logger.info("Searching LinkedIn for internships using jobpilot...")
+    async def run_all(self) -> Iterator[InternshipListing]:
+        """Run all company scrapers and the LinkedIn search concurrently, streaming their listings"""
+        # Scrapers are I/O-bound, so run them all at once on the shared session;
+        # the connector's pool limits bound how many requests are in flight overall
+        tasks = [asyncio.create_task(scraper(), name=scraper.__name__) for scraper in self._scrapers]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        try:
-            # Run the async LinkedIn search
-            internships = asyncio.run(self._search_linkedin_async())
-            
-            # Remove duplicates based on URL
-            seen_urls = set()
-            unique_internships = []
-            for internship in internships:
-                if internship.url not in seen_urls:
-                    seen_urls.add(internship.url)
-                    unique_internships.append(internship)
-                    
-            self.logger.info(f"Found {len(unique_internships)} unique LinkedIn internships")
-            return unique_internships
-            
-        except Exception as e:
-            self.logger.error(f"Error searching LinkedIn jobs: {e}")
-            return []
+        # Scrapers don't catch their own errors; a failure comes back here without affecting the others
+        for scraper, result in zip(self._scrapers, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error in scraper {scraper.__name__}: {result!r}")
+                
+        # Chain the per-scraper lists instead of copying them into one combined list
+        return chain.from_iterable(result for result in results if not isinstance(result, BaseException))
 
-    def collect_all_internships(self) -> List[InternshipListing]:
+    async def collect_all_internships(self) -> List[InternshipListing]:
         """Collect internships from all sources"""
-        all_internships = []
+        # Big pages are parsed on other cores; workers only start if a page needs one
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as self._parse_pool:
+            all_internships = await self.run_all()
+        self._parse_pool = None
         
-        # Define scraping functions for target companies
-        scrapers = [
-            self.scrape_apple_careers,
-            self.scrape_microsoft_careers,
-            self.scrape_google_careers,
-            self.scrape_meta_careers,
-            self.scrape_nvidia_careers,
-            self.scrape_spotify_careers,
-            self.scrape_palantir_careers
-        ]
-        
-        # Scrape each company with rate limiting
-        for scraper in scrapers:
-            try:
-                internships = scraper()
-                all_internships.extend(internships)
-                time.sleep(self.config['rate_limit_delay'])
-            except Exception as e:
-                self.logger.error(f"Error in scraper {scraper.__name__}: {e}")
-                
-        # Add LinkedIn results as fallback
-        linkedin_internships = self.search_linkedin_jobs()
-        all_internships.extend(linkedin_internships)
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_internships = []
-        for internship in all_internships:
-            if internship.url not in seen_urls:
-                seen_urls.add(internship.url)
-                unique_internships.append(internship)
-                
+        # Single dedupe pass over every scraper's listings, which compare by URL; insertion order keeps the source order
+        unique_internships = list(dict.fromkeys(all_internships))
         self.logger.info(f"Total unique internships found: {len(unique_internships)}")
-        return unique_internships
+        
+        # Only report listings that haven't been sent before
+        new_internships = self.filter_new_internships(unique_internships)
+        self.logger.info(f"New internships since last run: {len(new_internships)}")
+        return new_internships
 
     def format_telegram_message(self, internships: List[InternshipListing]) -> str:
         """Format internships into a Telegram message"""
+        escape = self.escape_markdown
+        timestamp = escape(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         if not internships:
-            return f"🤖 Internship Monitor Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\nNo new internships found in this run."
+            return f"🤖 Internship Monitor Report \\- {timestamp}\n\nNo new internships found in this run\\."
             
         # Group internships by company
-        by_company = {}
+        by_company = defaultdict(list)
         for internship in internships:
-            if internship.company not in by_company:
-                by_company[internship.company] = []
             by_company[internship.company].append(internship)
             
-        # Format message
-        message_parts = [
-            f"🚀 Internship Monitor Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        # Render every line from one generator and join once
+        header = (
+            f"🚀 Internship Monitor Report \\- {timestamp}",
             f"Found {len(internships)} SWE internships in EU/UK:\n"
-        ]
+        )
+        body = (
+            line
+            for company, company_internships in sorted(by_company.items(), key=lambda x: str(x[0]))
+            for line in (
+                f"*{escape(company)}* \\({len(company_internships)} positions\\):",
+                *(self._LISTING_LINE(
+                    escape(internship.title),
+                    " \\- " + escape(internship.location) if internship.location else "",
+                    self._MD_URL_SPECIAL_RE.sub(r"\\\1", internship.url)
+                  ) for internship in company_internships),
+                ""
+            )
+        )
+        return "\n".join((*header, *body))
+
+    def escape_markdown(self, text: str) -> str:
+        """Escape text for Telegram's MarkdownV2, in one regex pass"""
+        return self._MD_SPECIAL_RE.sub(r"\\\1", text)
+
+    async def _post_telegram(self, text: str):
+        """Post a single message to the configured Telegram chat"""
+        telegram_url = f"https://api.telegram.org/bot{self.config['telegram_bot_token']}/sendMessage"
+        payload = {
+            'chat_id': self.config['telegram_chat_id'],
+            'text': text,
+            'parse_mode': 'MarkdownV2',
+            'disable_web_page_preview': True
+        }
         
-        for company, company_internships in sorted(by_company.items(), key=lambda x: str(x[0])):
-            message_parts.append(f"**{company}** ({len(company_internships)} positions):")
-            for internship in company_internships:
-                location_text = f" - {internship.location}" if internship.location else ""
-                message_parts.append(f"  • {internship.title}{location_text} - [Apply]({internship.url})")
-            message_parts.append("")
-            
-        return "\n".join(message_parts)
+        async with self.session.post(telegram_url, data=orjson.dumps(payload),
+                                     headers={'Content-Type': 'application/json'}) as response:
+            response.raise_for_status()
+
+    def _chunk_message(self, message: str, limit: int = 4000) -> Iterator[str]:
+        """Pack a message into chunks of at most limit characters, keeping company blocks whole"""
+        current = ""
+        for block in message.split('\n\n'):
+            if len(block) + 2 <= limit and len(current) + len(block) + 2 > limit and current.strip():
+                yield current.strip()
+                current = ""
+            if len(current) + len(block) + 2 <= limit:
+                current += block + '\n\n'
+                continue
+                
+            # A block that can't fit in any chunk is split between its lines instead
+            for line in block.split('\n'):
+                if len(current) + len(line) + 1 > limit and current.strip():
+                    yield current.strip()
+                    current = ""
+                current += line + '\n'
+            current += '\n'
+        if current.strip():
+            yield current.strip()
 
-    def send_telegram_message(self, message: str) -> bool:
+    async def send_telegram_message(self, message: str) -> bool:
         """Send message via Telegram bot, splitting if too long"""
         try:
-            telegram_url = f"https://api.telegram.org/bot{self.config['telegram_bot_token']}/sendMessage"
+            # Telegram message limit is 4096 characters; leave some buffer
+            chunks = list(self._chunk_message(message, limit=4000))
             
-            # Telegram message limit is 4096 characters
-            max_length = 4000  # Leave some buffer
+            # Parts are posted one after another so they show up in the chat in order
+            for message_count, chunk in enumerate(chunks, 1):
+                header = f"📋 *Part {message_count}*\n\n" if message_count > 1 else ""
+                await self._post_telegram(header + chunk)
             
-            if len(message) <= max_length:
-                # Send single message
-                payload = {
-                    'chat_id': self.config['telegram_chat_id'],
-                    'text': message,
-                    'parse_mode': 'Markdown',
-                    'disable_web_page_preview': True
-                }
-                
-                response = self.session.post(telegram_url, json=payload, timeout=self.config['request_timeout'])
-                response.raise_for_status()
-                self.logger.info("Telegram message sent successfully")
-                return True
+            if len(chunks) > 1:
+                self.logger.info(f"Telegram message sent successfully in {len(chunks)} parts")
             else:
-                # Split message into multiple parts
-                lines = message.split('\n')
-                current_message = ""
-                message_count = 0
-                
-                for line in lines:
-                    if len(current_message + line + '\n') > max_length:
-                        # Send current message
-                        if current_message.strip():
-                            message_count += 1
-                            header = f"📋 **Part {message_count}**\n\n" if message_count > 1 else ""
-                            
-                            payload = {
-                                'chat_id': self.config['telegram_chat_id'],
-                                'text': header + current_message.strip(),
-                                'parse_mode': 'Markdown',
-                                'disable_web_page_preview': True
-                            }
-                            
-                            response = self.session.post(telegram_url, json=payload, timeout=self.config['request_timeout'])
-                            response.raise_for_status()
-                            
-                        current_message = line + '\n'
-                    else:
-                        current_message += line + '\n'
-                
-                # Send remaining message
-                if current_message.strip():
-                    message_count += 1
-                    header = f"📋 **Part {message_count}**\n\n" if message_count > 1 else ""
-                    
-                    payload = {
-                        'chat_id': self.config['telegram_chat_id'],
-                        'text': header + current_message.strip(),
-                        'parse_mode': 'Markdown',
-                        'disable_web_page_preview': True
-                    }
-                    
-                    response = self.session.post(telegram_url, json=payload, timeout=self.config['request_timeout'])
-                    response.raise_for_status()
-                
-                self.logger.info(f"Telegram message sent successfully in {message_count} parts")
-                return True
+                self.logger.info("Telegram message sent successfully")
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to send Telegram message: {e}")
             return False
 
-    def run(self):
-        """Main execution flow"""
+    async def run_async(self):
+        """Main execution flow: collect and report internships within a single event loop and HTTP session"""
         self.logger.info("Starting internship monitoring run...")
         
-        try:
-            # Collect all internships
-            internships = self.collect_all_internships()
-            
-            # Format and send message
-            message = self.format_telegram_message(internships)
-            success = self.send_telegram_message(message)
-            
-            if success:
-                self.logger.info(f"Monitoring run completed successfully. Found {len(internships)} internships.")
-            else:
-                self.logger.error("Failed to send Telegram notification")
+        async with self.create_session() as self.session:
+            try:
+                # Collect all internships
+                internships = await self.collect_all_internships()
+                self.save_http_cache()
                 
-        except Exception as e:
-            self.logger.error(f"Error in main execution: {e}")
-            
-            # Send error notification
-            error_message = f"🚨 Internship Monitor Error - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\nError: {str(e)}"
-            self.send_telegram_message(error_message)
+                # Format and send message
+                message = self.format_telegram_message(internships)
+                success = await self.send_telegram_message(message)
+                
+                if success:
+                    self.save_seen()
+                    self.logger.info(f"Monitoring run completed successfully. Found {len(internships)} internships.")
+                else:
+                    self.logger.error("Failed to send Telegram notification")
+                    
+            except Exception as e:
+                self.logger.error(f"Error in main execution: {e}")
+                
+                # Send error notification
+                error_message = self.escape_markdown(
+                    f"🚨 Internship Monitor Error - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\nError: {str(e)}"
+                )
+                await self.send_telegram_message(error_message)
 
 def main():
     """Entry point for the script"""
     try:
         monitor = InternshipMonitor()
-        monitor.run()
+        asyncio.run(monitor.run_async(), loop_factory=EVENT_LOOP_FACTORY)
     except Exception as e:
         print(f"Fatal error: {e}")
         return 1